@@ -2,32 +2,62 @@
 
 Scrapes upcoming film releases from WTW Cinemas and generates an iCalendar file.
 """
+import contextlib
 import datetime
+import functools
 import hashlib
+import importlib.util
+import io
 import json
 import logging
 import os
 import re
+import string
+import sys
+import threading
 import time
 import warnings
-from itertools import groupby
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby, repeat
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
 
 # Suppress urllib3/OpenSSL noise when system SSL is older (e.g. some CI or macOS)
 warnings.filterwarnings("ignore", message=".*OpenSSL.*", category=UserWarning)
 
 import requests
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson  # Optional: faster JSON for the cache files
+except ImportError:
+    orjson = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser  # Optional: faster listing page parsing
+except ImportError:
+    LexborHTMLParser = None
 
 # ============================================================================
 # CONSTANTS
 # ============================================================================
+# HTML Parsing Settings
+# BeautifulSoup backend: lxml's C parser when installed, else the pure-Python stdlib parser
+HTML_PARSER = "lxml" if importlib.util.find_spec("lxml") else "html.parser"
+
 # HTTP Request Settings
 HTTP_TIMEOUT = 60
 HTTP_RETRIES = 3
 HTTP_RETRY_DELAY = 1
 HTTP_RETRY_MULTIPLIER = 2
+# Keep-alive connections kept open per host by the shared session
+HTTP_POOL_SIZE = 16
+# Film detail pages fetched concurrently (one pool shared by all cinemas' listings)
+DETAIL_FETCH_WORKERS = 8
 USER_AGENT = (
     'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) '
     'AppleWebKit/537.36 (KHTML, like Gecko) '
@@ -37,6 +67,8 @@ USER_AGENT = (
 # iCalendar Settings
 ICAL_LINE_LENGTH = 75
 ICAL_NEWLINE = "\r\n"
+# DTSTAMP changes every run, so it is ignored when deciding whether a calendar changed
+DTSTAMP_LINE_PATTERN = re.compile(rb'^DTSTAMP:[0-9TZ]+\r\n', re.MULTILINE)
 CALENDAR_TIMEZONE = os.getenv("CALENDAR_TIMEZONE", "Europe/London")
 # Output for GitHub Pages: one .ics per cinema + index.html in docs/
 OUTPUT_DIR = "docs"
@@ -47,7 +79,8 @@ RELEASE_HISTORY_MAX_DAYS = 730
 # Synopsis Extraction Settings
 MIN_SYNOPSIS_LENGTH = 50
 MAX_SYNOPSIS_LENGTH = 500
-SYNOPSIS_SKIP_TERMS = ['cookie', 'privacy', 'terms', 'wheelchair', 'audio description']
+SYNOPSIS_SKIP_TERMS = ('cookie', 'privacy', 'terms', 'wheelchair', 'audio description')
+SYNOPSIS_SKIP_PATTERN = re.compile('|'.join(map(re.escape, SYNOPSIS_SKIP_TERMS)), re.IGNORECASE)
 
 # Logging
 LOG_FILE = "cinema_log.txt"
@@ -58,6 +91,19 @@ error_handler = logging.FileHandler(LOG_FILE)
 error_handler.setLevel(logging.ERROR)
 logger.addHandler(error_handler)
 
+# Guards film and TMDb cache writes from the fetch worker threads
+_cache_lock = threading.Lock()
+# Film pages fetched since the film cache was last written to disk (guarded by _cache_lock)
+_unsaved_cache_entries = 0
+
+# Shared HTTP session so repeat requests to the same host reuse the TCP/TLS connection
+SESSION = requests.Session()
+SESSION.headers['User-Agent'] = USER_AGENT
+SESSION.mount('https://', HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE))
+
+# Whole-second POSIX timestamp stamped once by main(); cache entries, expiry cutoffs and DTSTAMPs share it
+RUN_STARTED_AT: Optional[int] = None
+
 # ============================================================================
 # CONFIGURATION: Choose which cinemas to scrape
 # ============================================================================
@@ -150,18 +196,63 @@ NOTIFICATIONS = {
 # Cache film details to avoid re-scraping unchanged data
 CACHE_FILE = '.film_cache.json'
 CACHE_EXPIRY_DAYS = 7  # How many days to keep cached film details
+CACHE_SAVE_EVERY = 20  # Checkpoint the film cache after this many newly fetched films
+# Bookkeeping fields stored alongside cached page data (ETag/Last-Modified enable conditional GETs).
+# Film entries keep the scraped fields under 'details'; listing entries keep theirs under 'entries'.
+CACHE_META_KEYS = ('cached_at', 'etag', 'last_modified')
 
 # TMDb (optional enrichment when TMDB_API_KEY is set)
 TMDB_CACHE_FILE = '.tmdb_cache.json'
 TMDB_CACHE_DAYS = 30
-TMDB_DELAY_SEC = 0.2
+# Client-side rate limit, kept safely under TMDb's ~40 requests per 10 seconds
+TMDB_RATE_LIMIT = 35
+TMDB_RATE_PERIOD_SEC = 10
+TMDB_WORKERS = 5
+# Fetch director/cast via a second /movie/{id}?append_to_response=credits request per film.
+# Set to False to enrich from search results alone (overview, genres, rating) with half the requests.
+TMDB_FETCH_CREDITS = True
+# TMDb genre IDs, used when a response carries genre_ids rather than genre names (read-only)
+GENRE_MAP = MappingProxyType({
+    28: "Action", 12: "Adventure", 16: "Animation", 35: "Comedy", 80: "Crime",
+    99: "Documentary", 18: "Drama", 10751: "Family", 14: "Fantasy", 36: "History",
+    27: "Horror", 10402: "Music", 9648: "Mystery", 10749: "Romance", 878: "Science Fiction",
+    10770: "TV Movie", 53: "Thriller", 10752: "War", 37: "Western",
+})
 
 # Date pattern to match "Expected: DD Month YYYY" format
 DATE_PATTERN = re.compile(r"Expected:\s*(\d{1,2})\s+([A-Za-z]+)\s+(\d{4})")
 # Alternative pattern for "Expected at WTW Cinemas from the DDth Month"
 ALT_DATE_PATTERN = re.compile(r"Expected at WTW Cinemas from the (\d{1,2})(?:st|nd|rd|th)?\s+([A-Za-z]+)")
-
-
+# Month name -> number lookup for parse_date (case-insensitive, e.g. "october"/"oct" -> 10).
+# Spelled out rather than taken from calendar.month_name, which follows the process locale.
+MONTH_NAMES = (
+    'january', 'february', 'march', 'april', 'may', 'june',
+    'july', 'august', 'september', 'october', 'november', 'december',
+)
+MONTH_NUMBERS = {
+    **{name: number for number, name in enumerate(MONTH_NAMES, start=1)},
+    **{name[:3]: number for number, name in enumerate(MONTH_NAMES, start=1)},
+    'sept': 9,
+}
+# Runtime text like "119 minutes" or "95 mins"
+RUNTIME_PATTERN = re.compile(r"(\d+)\s*(?:minutes?|mins?)", re.IGNORECASE)
+# CSS selectors for coming soon listings: film entry date blocks and the link to the film's own page
+LISTING_TIMES_SELECTOR = "div.times"
+FILM_LINK_SELECTOR = 'a[href*="/film/"]'
+# Dedicated synopsis containers on a film page, checked before falling back to every <div>
+SYNOPSIS_SELECTOR = '[itemprop="description"], div.synopsis, div.description, section.film-description'
+# Trailing "(TBC)" style suffix on film titles
+TBC_SUFFIX_PATTERN = re.compile(r"\s*\([^)]*\)$")
+# Notification times in 24-hour HH:MM format
+TIME_PATTERN = re.compile(r"^([0-1]?[0-9]|2[0-3]):[0-5][0-9]$")
+# Title normalisation for TMDb matching and cache keys
+TITLE_SEPARATOR_PATTERN = re.compile(r"[\s\-:]+")
+SLUG_SEPARATOR_PATTERN = re.compile(r"[^a-z0-9]+")
+# WTW cast entries: 'Name (Character)'
+CAST_PART_PATTERN = re.compile(r"^([^(]+)(?:\s*\([^)]*\))?\s*$")
+
+
+@functools.lru_cache(maxsize=512)
 def get_base_film_url(url: str) -> str:
     """Extract base film URL without query parameters.
 
@@ -176,11 +267,126 @@ def get_base_film_url(url: str) -> str:
     return url
 
 
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON from bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize obj to compact UTF-8 JSON bytes, using orjson when it is installed.
+
+    The caches are only read back by this script, so no indentation is emitted.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _write_bytes_if_changed(path: Union[str, Path], data: bytes,
+                            ignore: Optional[re.Pattern] = None) -> bool:
+    """Write data to path unless the file already holds exactly these bytes.
+
+    The cache files and docs/ are committed by CI, so skipping identical
+    rewrites avoids needless disk writes and empty commits. Changed files are
+    replaced atomically.
+
+    Args:
+        path: File to write
+        data: New file contents
+        ignore: Optional bytes pattern whose matches are stripped from both
+            sides before comparing (e.g. per-run DTSTAMP lines)
+
+    Returns:
+        True if the file was written, False if it was already up to date
+    """
+    try:
+        with open(path, 'rb') as f:
+            old = f.read()
+        if ignore is None:
+            if old == data:
+                return False
+        elif ignore.sub(b'', old) == ignore.sub(b'', data):
+            return False
+    except FileNotFoundError:
+        pass
+    # Write a sibling temp file and swap it in, so a crash never leaves a truncated file
+    tmp_path = f"{os.fspath(path)}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+        raise
+    return True
+
+
+def _run_timestamp() -> int:
+    """Return this run's POSIX timestamp in whole seconds (the current time outside main)."""
+    return RUN_STARTED_AT if RUN_STARTED_AT is not None else int(time.time())
+
+
+def _run_date() -> datetime.date:
+    """Return this run's local calendar date, derived from _run_timestamp().
+
+    Year-less listing dates, release stats and history pruning all use it, so a run
+    that crosses midnight keeps a single reference date.
+    """
+    return datetime.date.fromtimestamp(_run_timestamp())
+
+
+def _cache_cutoff(days: int = CACHE_EXPIRY_DAYS) -> int:
+    """Return the POSIX timestamp before which cache entries older than `days` are expired."""
+    return _run_timestamp() - days * 86400
+
+
+def _cached_at_timestamp(value: Any) -> int:
+    """Return a cache entry's cached_at as a whole-second POSIX timestamp.
+
+    Entries are stamped with the run's integer POSIX timestamp; older cache files stored
+    float timestamps or ISO strings, which are converted so they keep expiring on schedule.
+    """
+    if isinstance(value, (int, float)):
+        return int(value)
+    if isinstance(value, str):
+        try:
+            return int(datetime.datetime.fromisoformat(value).timestamp())
+        except ValueError:
+            return 0
+    return 0
+
+
+def _conditional_headers(entry: Optional[dict]) -> Dict[str, str]:
+    """Build If-None-Match / If-Modified-Since headers from a cache entry's validators."""
+    headers = {}
+    if entry:
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+    return headers
+
+
+def _response_validators(response: requests.Response) -> Dict[str, str]:
+    """Return the ETag / Last-Modified validators a response carries, for caching."""
+    validators = {}
+    if response.headers.get('ETag'):
+        validators['etag'] = response.headers['ETag']
+    if response.headers.get('Last-Modified'):
+        validators['last_modified'] = response.headers['Last-Modified']
+    return validators
+
+
 def load_cache() -> Dict[str, dict]:
     """Load the film details cache from disk.
 
     Loads cached film details from CACHE_FILE and removes expired entries.
-    Expired entries are older than CACHE_EXPIRY_DAYS.
+    Expired entries are older than CACHE_EXPIRY_DAYS; those that carry an ETag or
+    Last-Modified validator are kept so the page can be revalidated with a
+    conditional GET instead of being downloaded and parsed again.
 
     Returns:
         Dictionary mapping film URLs to cached film details.
@@ -190,12 +396,23 @@ def load_cache() -> Dict[str, dict]:
         return {}
 
     try:
-        with open(CACHE_FILE, 'r', encoding='utf-8') as f:
-            cache = json.load(f)
-
-        # Clean expired entries
-        cutoff_date = (datetime.datetime.now() - datetime.timedelta(days=CACHE_EXPIRY_DAYS)).isoformat()
-        cache = {url: data for url, data in cache.items() if data.get('cached_at', '') > cutoff_date}
+        with open(CACHE_FILE, 'rb') as f:
+            cache = _json_loads(f.read())
+
+        # Clean expired entries that cannot be revalidated
+        cutoff = _cache_cutoff()
+        for url, data in cache.items():
+            data['cached_at'] = _cached_at_timestamp(data.get('cached_at'))
+            if 'details' not in data and 'entries' not in data:
+                # Older caches stored film details flat, mixed in with the bookkeeping fields
+                cache[url] = {
+                    'details': {k: v for k, v in data.items() if k not in CACHE_META_KEYS},
+                    **{k: data[k] for k in CACHE_META_KEYS if k in data},
+                }
+        cache = {
+            url: data for url, data in cache.items()
+            if data['cached_at'] > cutoff or _conditional_headers(data)
+        }
 
         logger.info("Loaded cache with %d entries", len(cache))
         return cache
@@ -210,16 +427,27 @@ def load_cache() -> Dict[str, dict]:
         return {}
 
 
-def save_cache(cache: Dict[str, dict]) -> None:
+def save_cache(cache: Dict[str, dict], prune: bool = True) -> None:
     """Save the film details cache to disk.
 
+    Entries that are still expired (not revalidated during this run) are dropped
+    unless prune is False, as for the mid-run checkpoints taken while they may
+    still be revalidated.
+
     Args:
         cache: Dictionary mapping film URLs to film details to be saved
+        prune: Drop expired entries before saving
     """
+    global _unsaved_cache_entries
+    _unsaved_cache_entries = 0
+    if prune:
+        cutoff = _cache_cutoff()
+        cache = {url: data for url, data in cache.items() if data.get('cached_at', 0) > cutoff}
     try:
-        with open(CACHE_FILE, 'w', encoding='utf-8') as f:
-            json.dump(cache, f, indent=2, ensure_ascii=False)
-        logger.info("Saved cache with %d entries", len(cache))
+        if _write_bytes_if_changed(CACHE_FILE, _json_dumps(cache)):
+            logger.info("Saved cache with %d entries", len(cache))
+        else:
+            logger.info("Cache unchanged (%d entries)", len(cache))
     except (OSError, IOError) as e:
         logger.error("Failed to write cache file: %s", e)
     except Exception as e:
@@ -232,7 +460,7 @@ def load_release_history() -> set:
     if not path.is_file():
         return set()
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
+        data = _json_loads(path.read_bytes())
         out = set()
         for item in data:
             if isinstance(item, (list, tuple)) and len(item) >= 2:
@@ -250,51 +478,56 @@ def load_release_history() -> set:
 def save_release_history(releases: set) -> None:
     """Persist (date, title) set for History stats. Keeps last RELEASE_HISTORY_MAX_DAYS."""
     path = Path(RELEASE_HISTORY_PATH)
-    today = datetime.date.today()
-    cutoff = today - datetime.timedelta(days=RELEASE_HISTORY_MAX_DAYS)
-    kept = [(d.isoformat(), t) for (d, t) in releases if d >= cutoff]
+    cutoff = _run_date() - datetime.timedelta(days=RELEASE_HISTORY_MAX_DAYS)
+    # Sorted so an unchanged history serializes identically and is not rewritten
+    kept = sorted((d.isoformat(), t) for (d, t) in releases if d >= cutoff)
     try:
-        path.write_text(json.dumps(kept, ensure_ascii=False), encoding="utf-8")
+        _write_bytes_if_changed(path, _json_dumps(kept))
         logger.info("Saved release history with %d entries", len(kept))
     except OSError as e:
         logger.warning("Release history save failed: %s", e)
 
 
 def load_tmdb_cache() -> Dict[str, dict]:
-    """Load TMDb cache; drop expired entries."""
+    """Load TMDb cache; drop expired entries unless they record a tmdb_id to refresh by."""
     if not os.path.exists(TMDB_CACHE_FILE):
         return {}
     try:
-        with open(TMDB_CACHE_FILE, 'r', encoding='utf-8') as f:
-            cache = json.load(f)
-        cutoff = (datetime.datetime.now() - datetime.timedelta(days=TMDB_CACHE_DAYS)).isoformat()
-        return {k: v for k, v in cache.items() if v.get('cached_at', '') > cutoff}
+        with open(TMDB_CACHE_FILE, 'rb') as f:
+            cache = _json_loads(f.read())
+        cutoff = _cache_cutoff(TMDB_CACHE_DAYS)
+        for v in cache.values():
+            v['cached_at'] = _cached_at_timestamp(v.get('cached_at'))
+        return {k: v for k, v in cache.items() if v['cached_at'] > cutoff or v.get('tmdb_id')}
     except (json.JSONDecodeError, OSError) as e:
         logger.warning("TMDb cache load failed: %s", e)
         return {}
 
 
 def save_tmdb_cache(cache: Dict[str, dict]) -> None:
-    """Save TMDb cache to disk."""
+    """Save TMDb cache to disk; expired entries not refreshed during this run are dropped."""
+    cutoff = _cache_cutoff(TMDB_CACHE_DAYS)
+    cache = {k: v for k, v in cache.items() if v.get('cached_at', 0) > cutoff}
     try:
-        with open(TMDB_CACHE_FILE, 'w', encoding='utf-8') as f:
-            json.dump(cache, f, indent=2, ensure_ascii=False)
+        _write_bytes_if_changed(TMDB_CACHE_FILE, _json_dumps(cache))
     except OSError as e:
         logger.warning("TMDb cache save failed: %s", e)
 
 
+@functools.lru_cache(maxsize=1024)
 def _tmdb_cache_key(film_title: str) -> str:
     """Stable cache key from film title (normalise for search)."""
-    t = re.sub(r"\s*\([^)]*\)$", "", film_title).strip()
-    t = re.sub(r"[\s\-:]+", " ", t.lower()).strip()
-    return re.sub(r"[^a-z0-9]+", "-", t).strip("-") or "unknown"
+    t = TBC_SUFFIX_PATTERN.sub("", film_title).strip()
+    t = TITLE_SEPARATOR_PATTERN.sub(" ", t.lower()).strip()
+    return SLUG_SEPARATOR_PATTERN.sub("-", t).strip("-") or "unknown"
 
 
+@functools.lru_cache(maxsize=1024)
 def _normalize_title_for_match(title: str) -> str:
     """Normalize title for TMDb result matching."""
     if not title:
         return ""
-    return re.sub(r"[\s\-:]+", " ", title.lower()).strip()
+    return TITLE_SEPARATOR_PATTERN.sub(" ", title.lower()).strip()
 
 
 def _pick_best_tmdb_result(results: List[Dict], search_title: str) -> Optional[Dict]:
@@ -304,13 +537,16 @@ def _pick_best_tmdb_result(results: List[Dict], search_title: str) -> Optional[D
     norm_search = _normalize_title_for_match(search_title)
     if not norm_search:
         return results[0]
+    # Normalise each result title once; an exact match (first one wins) skips scoring
+    normalized = [(_normalize_title_for_match((r.get("title") or "").strip()), r) for r in results]
+    exact_matches: Dict[str, Dict] = {}
+    for norm_title, r in normalized:
+        exact_matches.setdefault(norm_title, r)
+    if norm_search in exact_matches:
+        return exact_matches[norm_search]
     best = None
     best_score = -1
-    for r in results:
-        title = (r.get("title") or "").strip()
-        norm_title = _normalize_title_for_match(title)
-        if norm_title == norm_search:
-            return r
+    for norm_title, r in normalized:
         score = 0
         if norm_search in norm_title:
             score = 90
@@ -329,22 +565,57 @@ def _pick_best_tmdb_result(results: List[Dict], search_title: str) -> Optional[D
     return best if best is not None else results[0]
 
 
+class RateLimiter:
+    """Sliding-window rate limiter shared by worker threads.
+
+    Allows at most `rate` calls to acquire() in any `per`-second window,
+    sleeping only when the window is full.
+    """
+
+    def __init__(self, rate: int, per: float) -> None:
+        self.rate = rate
+        self.per = per
+        self._calls: deque = deque()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until another call fits within the rate limit."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self._calls and now - self._calls[0] >= self.per:
+                    self._calls.popleft()
+                if len(self._calls) < self.rate:
+                    self._calls.append(now)
+                    return
+                wait = self.per - (now - self._calls[0])
+            time.sleep(wait)
+
+
+TMDB_RATE_LIMITER = RateLimiter(TMDB_RATE_LIMIT, TMDB_RATE_PERIOD_SEC)
+
+
 def enrich_film_tmdb(
     film_title: str,
     film_url: str,
     api_key: str,
     cache: Dict[str, dict],
+    need_credits: bool = True,
 ) -> Dict[str, Any]:
     """Fetch TMDb data for a film; return dict with overview, genres, vote_average, director, cast (first 6 names).
     Uses cache key from normalised title. Returns empty dict on failure or miss.
+    With need_credits=False the search result alone is used (no detail request; director and cast left empty).
+    Expired entries that recorded a tmdb_id are refreshed straight from /movie/{id}, skipping the search.
     """
-    search_title = re.sub(r"\s*\([^)]*\)$", "", film_title).strip()
+    search_title = TBC_SUFFIX_PATTERN.sub("", film_title).strip()
     if not search_title:
         return {}
     cache_key = _tmdb_cache_key(film_title)
 
-    if cache_key in cache:
-        entry = cache[cache_key]
+    entry = cache.get(cache_key)
+    fresh = entry is not None and entry.get("cached_at", 0) > _cache_cutoff(TMDB_CACHE_DAYS)
+    # Entries cached without credits don't satisfy a caller that needs director/cast
+    if fresh and (entry.get("has_credits", True) or not need_credits):
         va = entry.get("vote_average")
         # Treat 0.0 as no rating (e.g. new release with 0 votes)
         if va is not None and float(va) == 0.0:
@@ -357,45 +628,46 @@ def enrich_film_tmdb(
             "cast": entry.get("cast") or "",
         }
 
-    time.sleep(TMDB_DELAY_SEC)
+    # A previously matched film is refreshed by ID without repeating the search
+    movie_id = entry.get("tmdb_id") if entry is not None else None
+    chosen: Dict[str, Any] = {}
+
     try:
-        search_url = "https://api.themoviedb.org/3/search/movie"
-        search_r = requests.get(
-            search_url,
-            params={"api_key": api_key, "query": search_title, "language": "en-GB"},
-            headers={"User-Agent": USER_AGENT},
-            timeout=10,
-        )
-        search_r.raise_for_status()
-        data = search_r.json()
-        results = data.get("results") or []
-        if not results:
-            cache[cache_key] = {"overview": "", "genres": [], "vote_average": None, "director": "", "cast": "", "cached_at": datetime.datetime.now().isoformat()}
-            return {}
-        chosen = _pick_best_tmdb_result(results, search_title)
-        if not chosen:
-            return {}
-        movie_id = chosen.get("id")
         if not movie_id:
-            return {}
-
-        time.sleep(TMDB_DELAY_SEC)
-        detail_url = f"https://api.themoviedb.org/3/movie/{movie_id}"
-        detail_r = requests.get(
-            detail_url,
-            params={"api_key": api_key, "append_to_response": "credits", "language": "en-GB"},
-            headers={"User-Agent": USER_AGENT},
-            timeout=10,
-        )
-        detail_r.raise_for_status()
-        movie = detail_r.json()
-
-        GENRE_MAP = {
-            28: "Action", 12: "Adventure", 16: "Animation", 35: "Comedy", 80: "Crime",
-            99: "Documentary", 18: "Drama", 10751: "Family", 14: "Fantasy", 36: "History",
-            27: "Horror", 10402: "Music", 9648: "Mystery", 10749: "Romance", 878: "Science Fiction",
-            10770: "TV Movie", 53: "Thriller", 10752: "War", 37: "Western",
-        }
+            TMDB_RATE_LIMITER.acquire()
+            search_url = "https://api.themoviedb.org/3/search/movie"
+            search_r = SESSION.get(
+                search_url,
+                params={"api_key": api_key, "query": search_title, "language": "en-GB"},
+                timeout=10,
+            )
+            search_r.raise_for_status()
+            data = search_r.json()
+            results = data.get("results") or []
+            if not results:
+                with _cache_lock:
+                    cache[cache_key] = {"overview": "", "genres": [], "vote_average": None, "director": "", "cast": "", "cached_at": _run_timestamp()}
+                return {}
+            chosen = _pick_best_tmdb_result(results, search_title)
+            if not chosen:
+                return {}
+            movie_id = chosen.get("id")
+            if not movie_id:
+                return {}
+
+        if need_credits or not chosen:
+            TMDB_RATE_LIMITER.acquire()
+            detail_url = f"https://api.themoviedb.org/3/movie/{movie_id}"
+            detail_params = {"api_key": api_key, "language": "en-GB"}
+            if need_credits:
+                detail_params["append_to_response"] = "credits"
+            detail_r = SESSION.get(detail_url, params=detail_params, timeout=10)
+            detail_r.raise_for_status()
+            movie = detail_r.json()
+        else:
+            # Search results already carry overview, vote_average, vote_count and genre_ids
+            movie = chosen
+
         genre_list = movie.get("genres") or []
         genres = [g.get("name", "").strip() for g in genre_list if g.get("name")]
         if not genres:
@@ -427,18 +699,21 @@ def enrich_film_tmdb(
             "director": director_str,
             "cast": cast_str,
         }
-        cache[cache_key] = {**out, "cached_at": datetime.datetime.now().isoformat()}
+        with _cache_lock:
+            cache[cache_key] = {**out, "tmdb_id": movie_id, "has_credits": need_credits, "cached_at": _run_timestamp()}
         return out
     except (requests.RequestException, KeyError, ValueError, TypeError) as e:
         logger.warning("TMDb enrich failed for %s: %s", search_title, e)
-        cache[cache_key] = {"overview": "", "genres": [], "vote_average": None, "director": "", "cast": "", "cached_at": datetime.datetime.now().isoformat()}
+        with _cache_lock:
+            cache[cache_key] = {"overview": "", "genres": [], "vote_average": None, "director": "", "cast": "", "cached_at": _run_timestamp()}
         return {}
 
 
 def fetch_with_retries(
     url: str,
     retries: int = HTTP_RETRIES,
-    timeout: int = HTTP_TIMEOUT
+    timeout: int = HTTP_TIMEOUT,
+    conditional_headers: Optional[Dict[str, str]] = None
 ) -> requests.Response:
     """Return HTTP response, retrying with exponential backoff on errors.
 
@@ -446,19 +721,20 @@ def fetch_with_retries(
         url: The URL to fetch
         retries: Number of retry attempts
         timeout: Request timeout in seconds
+        conditional_headers: Optional If-None-Match / If-Modified-Since headers
 
     Returns:
-        HTTP response object
+        HTTP response object (status 304 if conditional headers were sent and
+        the page has not changed)
 
     Raises:
         requests.RequestException: If all retry attempts fail
     """
-    headers = {'User-Agent': USER_AGENT}
     delay = HTTP_RETRY_DELAY
 
     for attempt in range(retries):
         try:
-            response = requests.get(url, headers=headers, timeout=timeout)
+            response = SESSION.get(url, headers=conditional_headers, timeout=timeout)
             response.raise_for_status()
             return response
         except requests.RequestException as exc:
@@ -469,7 +745,7 @@ def fetch_with_retries(
             delay *= HTTP_RETRY_MULTIPLIER
 
 
-def parse_date(text: str) -> Optional[datetime.date]:
+def parse_date(text: str, today: Optional[datetime.date] = None) -> Optional[datetime.date]:
     """Parse date from various formats found on the cinema website.
 
     Supports two formats:
@@ -480,12 +756,14 @@ def parse_date(text: str) -> Optional[datetime.date]:
 
     Args:
         text: Text containing a date string
+        today: Reference date for year-less dates; defaults to _run_date()
 
     Returns:
         Parsed date object, or None if parsing fails
     """
     # Try the primary format: "Expected: 10 October 2025"
     match = DATE_PATTERN.search(text)
+    explicit_year = match is not None
     if match:
         day = int(match.group(1))
         month_str = match.group(2)
@@ -498,19 +776,19 @@ def parse_date(text: str) -> Optional[datetime.date]:
         day = int(match.group(1))
         month_str = match.group(2)
         # If year is not in text, assume current or next year based on month
-        current_date = datetime.date.today()
-        year = current_date.year
+        if today is None:
+            today = _run_date()
+        year = today.year
 
-    try:
-        month = datetime.datetime.strptime(month_str, "%B").month
-    except ValueError:
+    month = MONTH_NUMBERS.get(month_str.lower())
+    if month is None:
         logger.error("Unrecognised month '%s' in line: %s", month_str, text)
         return None
 
     try:
         parsed_date = datetime.date(year, month, day)
         # If the date is in the past and we didn't have an explicit year, assume next year
-        if parsed_date < datetime.date.today() and not DATE_PATTERN.search(text):
+        if not explicit_year and parsed_date < today:
             parsed_date = datetime.date(year + 1, month, day)
         return parsed_date
     except ValueError:
@@ -518,6 +796,27 @@ def parse_date(text: str) -> Optional[datetime.date]:
         return None
 
 
+def _fresh_cached_details(base_url: str, cache: Dict[str, dict]) -> Optional[Dict[str, str]]:
+    """Return unexpired cached details for a base film URL, or None on a miss."""
+    cached = cache.get(base_url)
+    if cached is None or cached.get('cached_at', 0) <= _cache_cutoff():
+        return None
+    logger.info("Using cached data for: %s", base_url)
+    return cached['details']
+
+
+def _checkpoint_cache(cache: Dict[str, dict]) -> None:
+    """Count a newly fetched film and save the cache every CACHE_SAVE_EVERY films.
+
+    Keeps a crashed run from losing more than a handful of fetches. Callers hold
+    _cache_lock, so no worker mutates the cache while it is serialized.
+    """
+    global _unsaved_cache_entries
+    _unsaved_cache_entries += 1
+    if _unsaved_cache_entries >= CACHE_SAVE_EVERY:
+        save_cache(cache, prune=False)
+
+
 def fetch_film_details(film_url: str, cache: Dict[str, dict]) -> Dict[str, str]:
     """Fetch detailed information about a film from its individual page.
 
@@ -543,59 +842,82 @@ def fetch_film_details(film_url: str, cache: Dict[str, dict]) -> Dict[str, str]:
     base_url = get_base_film_url(film_url)
 
     # Check cache first
-    if base_url in cache:
-        logger.info("Using cached data for: %s", base_url)
-        cached_details = cache[base_url].copy()
-        cached_details.pop('cached_at', None)  # Remove cache metadata
+    cached_details = _fresh_cached_details(base_url, cache)
+    if cached_details is not None:
         return cached_details
+    cached = cache.get(base_url)
 
     try:
         logger.info("Fetching film details from: %s", film_url)
-        response = fetch_with_retries(film_url)
-        soup = BeautifulSoup(response.text, "html.parser")
-
-        # Extract runtime - look for text like "119 minutes"
-        runtime_pattern = re.compile(r'(\d+)\s*(?:minutes?|mins?)', re.IGNORECASE)
+        response = fetch_with_retries(film_url, conditional_headers=_conditional_headers(cached))
+        if response.status_code == requests.codes.not_modified and cached is not None:
+            # Page unchanged since it was cached: keep the details, just renew the timestamp
+            logger.info("Film page not modified, reusing cached data for: %s", base_url)
+            with _cache_lock:
+                cache[base_url] = {**cached, 'cached_at': _run_timestamp()}
+            return cached['details']
+
+        soup = BeautifulSoup(response.content, HTML_PARSER)
+
+        # Extract runtime (text like "119 minutes") and cast ("Starring:" label)
+        # in a single walk over the page text, stopping once both are found
         for text in soup.stripped_strings:
-            match = runtime_pattern.search(text)
-            if match:
-                details['runtime'] = f"{match.group(1)} min"
-                break
-
-        # Extract cast - look for "Starring:" label
-        for text in soup.stripped_strings:
-            if 'starring' in text.lower():
-                # Get the next few text nodes
+            if not details['runtime']:
+                match = RUNTIME_PATTERN.search(text)
+                if match:
+                    details['runtime'] = f"{match.group(1)} min"
+            if not details['cast'] and 'starring' in text.lower():
                 cast_text = text.split(':', 1)[-1].strip()
                 if cast_text and len(cast_text) > 3:
                     details['cast'] = cast_text
-                    break
+            if details['runtime'] and details['cast']:
+                break
 
         # Extract synopsis - look for paragraph with substantial text
         # Usually in a div or section describing the film
-        for p in soup.find_all('p'):
+        # (one tree walk collects both candidate kinds; paragraphs still take priority)
+        blocks = soup.find_all(['p', 'div'])
+        for p in blocks:
+            if p.name != 'p':
+                continue
             text = p.get_text(strip=True)
             # Synopsis is usually longer than MIN_SYNOPSIS_LENGTH characters
-            if (len(text) > MIN_SYNOPSIS_LENGTH and
-                not any(skip in text.lower() for skip in SYNOPSIS_SKIP_TERMS)):
+            if len(text) <= MIN_SYNOPSIS_LENGTH:
+                continue
+            if not SYNOPSIS_SKIP_PATTERN.search(text):
                 details['synopsis'] = text
                 break
 
+        # Try a dedicated synopsis container before walking every div on the page
+        if not details['synopsis']:
+            # Matches come back in document order, so take the first that passes the checks
+            # (e.g. an empty <meta itemprop="description"> in <head> must not hide a later div)
+            for container in soup.select(SYNOPSIS_SELECTOR):
+                text = container.get_text(strip=True)
+                if MIN_SYNOPSIS_LENGTH < len(text) < MAX_SYNOPSIS_LENGTH and not SYNOPSIS_SKIP_PATTERN.search(text):
+                    details['synopsis'] = text
+                    break
+
         # Try to find synopsis in other places if not found
         if not details['synopsis']:
-            for div in soup.find_all('div'):
+            for div in blocks:
+                if div.name != 'div':
+                    continue
                 text = div.get_text(strip=True)
-                if (MIN_SYNOPSIS_LENGTH < len(text) < MAX_SYNOPSIS_LENGTH and
-                    not any(skip in text.lower() for skip in SYNOPSIS_SKIP_TERMS)):
+                if not MIN_SYNOPSIS_LENGTH < len(text) < MAX_SYNOPSIS_LENGTH:
+                    continue
+                if not SYNOPSIS_SKIP_PATTERN.search(text):
                     details['synopsis'] = text
                     break
 
         logger.info("Film details extracted: runtime=%s, cast=%s, synopsis_length=%d",
                    details['runtime'], bool(details['cast']), len(details['synopsis']))
 
-        # Add to cache with timestamp using base URL as key
-        cache[base_url] = details.copy()
-        cache[base_url]['cached_at'] = datetime.datetime.now().isoformat()
+        # Add to cache with timestamp (and validators for the next refresh) using base URL as key
+        entry = {'details': details, **_response_validators(response), 'cached_at': _run_timestamp()}
+        with _cache_lock:
+            cache[base_url] = entry
+            _checkpoint_cache(cache)
 
     except requests.RequestException as e:
         logger.warning("Network error fetching film details from %s: %s", film_url, e)
@@ -605,31 +927,24 @@ def fetch_film_details(film_url: str, cache: Dict[str, dict]) -> Dict[str, str]:
     return details
 
 
-def extract_films(
-    url: str,
-    cinema_name: str,
-    cache: Dict[str, dict]
-) -> List[Tuple[datetime.date, str, str, str, Dict[str, str]]]:
-    """Extract film releases from the cinema website.
+def _parse_listing(content: bytes) -> List[Tuple[str, str, str]]:
+    """Parse a coming soon page into (film_title, date_text, film_url) entries.
 
     Args:
-        url: Coming soon page URL for the cinema
-        cinema_name: Name of the cinema
-        cache: Cache dictionary for film details
+        content: Raw HTML of the cinema's coming soon page
 
     Returns:
-        List of tuples: (release_date, film_title, cinema_name, film_url, film_details)
+        List of (film_title, date_text, film_url) tuples in page order
     """
-    logger.info("Fetching from URL: %s (%s)", url, cinema_name)
-    response = fetch_with_retries(url)
-    soup = BeautifulSoup(response.text, "html.parser")
+    if LexborHTMLParser is not None:
+        return _parse_listing_selectolax(content)
 
-    films: List[Tuple[datetime.date, str, str, str, Dict[str, str]]] = []
-    seen_keys: set[Tuple[datetime.date, str, str, str]] = set()
+    soup = BeautifulSoup(content, HTML_PARSER)
+    entries: List[Tuple[str, str, str]] = []
 
     # Find all film entries - they are in div.times elements
     # Structure: li > a (with URL) + figcaption > h2 (title) + div.times > p (date)
-    times_divs = soup.find_all("div", class_="times")
+    times_divs = soup.select(LISTING_TIMES_SELECTOR)
 
     for times_div in times_divs:
         # Get parent li element
@@ -645,7 +960,7 @@ def extract_films(
         title = title_elem.get_text(strip=True)
 
         # Remove "(TBC)" or similar suffixes from title
-        title = re.sub(r"\s*\([^)]*\)$", "", title)
+        title = TBC_SUFFIX_PATTERN.sub("", title)
 
         # Extract expected date from p tag inside div.times
         date_elem = times_div.find("p")
@@ -653,34 +968,173 @@ def extract_films(
             continue
 
         date_text = date_elem.get_text(strip=True)
-        release_date = parse_date(date_text)
 
         # Extract the film URL from the a tag in parent li
         film_url = ""
-        link_elem = parent_li.find("a", href=re.compile(r'/film/'))
+        link_elem = parent_li.select_one(FILM_LINK_SELECTOR)
         if link_elem:
             film_url = link_elem.get('href', '')
 
-        if release_date and title:
-            # Fetch detailed information about the film (uses cache if available)
-            film_details = fetch_film_details(film_url, cache)
+        entries.append((title, date_text, film_url))
+
+    return entries
+
 
-            # Check for duplicates before adding (same film, date, and cinema)
-            film_tuple = (release_date, title, cinema_name, film_url, film_details)
+def _parse_listing_selectolax(content: bytes) -> List[Tuple[str, str, str]]:
+    """Parse a coming soon page with selectolax; mirrors _parse_listing.
+
+    Args:
+        content: Raw HTML of the cinema's coming soon page
+
+    Returns:
+        List of (film_title, date_text, film_url) tuples in page order
+    """
+    tree = LexborHTMLParser(content)
+    entries: List[Tuple[str, str, str]] = []
+
+    for times_div in tree.css(LISTING_TIMES_SELECTOR):
+        parent_li = times_div.parent
+        if parent_li is None:
+            continue
+
+        title_elem = parent_li.css_first("h2")
+        if title_elem is None:
+            continue
+        title = TBC_SUFFIX_PATTERN.sub("", title_elem.text(strip=True))
+
+        date_elem = times_div.css_first("p")
+        if date_elem is None:
+            continue
+        date_text = date_elem.text(strip=True)
+
+        film_url = ""
+        link_elem = parent_li.css_first(FILM_LINK_SELECTOR)
+        if link_elem is not None:
+            film_url = link_elem.attributes.get('href') or ''
+
+        entries.append((title, date_text, film_url))
+
+    return entries
+
+
+def extract_film_listings(
+    url: str,
+    cinema_name: str,
+    cache: Dict[str, dict]
+) -> List[Tuple[datetime.date, str, str]]:
+    """Scrape a cinema's coming soon page into dated, de-duplicated listings.
+
+    Only the listing page is fetched; film details are resolved separately by
+    fetch_all_film_details so films shared between cinemas are fetched once.
+
+    Args:
+        url: Coming soon page URL for the cinema
+        cinema_name: Name of the cinema
+        cache: Cache dictionary for film details and listing validators
+
+    Returns:
+        List of tuples: (release_date, film_title, film_url) in page order
+    """
+    logger.info("Fetching from URL: %s (%s)", url, cinema_name)
+    cached_listing = cache.get(url)
+    response = fetch_with_retries(url, conditional_headers=_conditional_headers(cached_listing))
+    if response.status_code == requests.codes.not_modified and cached_listing is not None:
+        # Listing unchanged since last run: reuse the entries parsed then
+        logger.info("Listing not modified, reusing cached entries for: %s", url)
+        entries = cached_listing['entries']
+        listing_entry = {**cached_listing, 'cached_at': _run_timestamp()}
+    else:
+        entries = _parse_listing(response.content)
+        validators = _response_validators(response)
+        listing_entry = None
+        if validators:
+            listing_entry = {'entries': entries, **validators, 'cached_at': _run_timestamp()}
+
+    # Keep the parsed entries so the next run can revalidate the listing with a conditional GET
+    if listing_entry:
+        with _cache_lock:
+            cache[url] = listing_entry
+
+    seen_keys: set[Tuple[datetime.date, str, str, str]] = set()
+    listings: List[Tuple[datetime.date, str, str]] = []
+    today = _run_date()
+
+    for title, date_text, film_url in entries:
+        release_date = parse_date(date_text, today)
+        if release_date and title:
+            # Check for duplicates before scheduling any fetch (same film, date, and cinema)
             dedupe_key = (release_date, title, cinema_name, film_url)
-            if dedupe_key not in seen_keys:
-                films.append(film_tuple)
-                seen_keys.add(dedupe_key)
-                logger.info("Found film: %s on %s at %s (URL: %s)", title, release_date, cinema_name, film_url)
+            if dedupe_key in seen_keys:
+                continue
+            seen_keys.add(dedupe_key)
+            listings.append((release_date, title, film_url))
+
+    return listings
+
+
+def fetch_all_film_details(film_urls: Iterable[str], cache: Dict[str, dict]) -> Dict[str, Dict[str, str]]:
+    """Fetch details for each distinct film page, keyed by base film URL.
+
+    Fresh cache hits are resolved inline; only the misses are fetched, concurrently.
 
+    Args:
+        film_urls: Film page URLs (may repeat, and may differ only by ?screen=)
+        cache: Cache dictionary for film details
+
+    Returns:
+        Dictionary mapping base film URLs to film details
+    """
+    unique_urls: Dict[str, str] = {}
+    for film_url in film_urls:
+        unique_urls.setdefault(get_base_film_url(film_url), film_url)
+    details_by_url: Dict[str, Dict[str, str]] = {}
+    pending: Dict[str, str] = {}
+    for base_url, film_url in unique_urls.items():
+        cached_details = _fresh_cached_details(base_url, cache) if film_url else None
+        if cached_details is not None:
+            details_by_url[base_url] = cached_details
+        else:
+            pending[base_url] = film_url
+    if pending:
+        with ThreadPoolExecutor(max_workers=min(DETAIL_FETCH_WORKERS, len(pending))) as executor:
+            details_by_url.update(zip(
+                pending,
+                executor.map(fetch_film_details, pending.values(), repeat(cache)),
+            ))
+    return details_by_url
+
+
+class FilmRecord(NamedTuple):
+    """One film release at one cinema, as written to that cinema's calendar."""
+    release_date: datetime.date
+    title: str
+    cinema_name: str
+    film_url: str
+    details: Dict[str, Any]
+    cinema_id: str = ""
+
+
+def _films_from_listings(
+    listings: List[Tuple[datetime.date, str, str]],
+    cinema_name: str,
+    details_by_url: Dict[str, Dict[str, str]],
+    cinema_id: str = ""
+) -> List[FilmRecord]:
+    """Attach fetched details to a cinema's listings, producing film records."""
+    films: List[FilmRecord] = []
+    for release_date, title, film_url in listings:
+        film_details = details_by_url[get_base_film_url(film_url)]
+        films.append(FilmRecord(release_date, title, cinema_name, film_url, film_details, cinema_id))
+        logger.info("Found film: %s on %s at %s (URL: %s)", title, release_date, cinema_name, film_url)
     return films
 
 
+@functools.lru_cache(maxsize=1024)
 def _format_runtime_display(runtime_str: str) -> str:
     """Format runtime for display: '119 min' -> '2h 1min', '45 min' -> '45 min'."""
     if not runtime_str or not isinstance(runtime_str, str):
         return ""
-    m = re.search(r"(\d+)\s*(?:minutes?|mins?)", runtime_str, re.IGNORECASE)
+    m = RUNTIME_PATTERN.search(runtime_str)
     if not m:
         return runtime_str.strip()
     minutes = int(m.group(1))
@@ -718,7 +1172,7 @@ def _cast_first_six_names(cast_str: str) -> str:
         part = part.strip()
         if not part:
             continue
-        m = re.match(r"^([^(]+)(?:\s*\([^)]*\))?\s*$", part)
+        m = CAST_PART_PATTERN.match(part)
         if m:
             name = m.group(1).strip()
             if name and name not in names:
@@ -751,78 +1205,111 @@ def escape_and_fold_ical_text(text: str, prefix: str = "") -> str:
     # Add the prefix to create the full line
     full_line = prefix + escaped
 
-    # Fold lines at ICAL_LINE_LENGTH characters (RFC 5545 recommends 75 octets)
+    # Fold lines at ICAL_LINE_LENGTH octets of UTF-8 (RFC 5545 counts octets, not characters)
     # Continuation lines must start with a single space
-    if len(full_line) <= ICAL_LINE_LENGTH:
+    if full_line.isascii():
+        # One octet per character: fold boundaries are plain slice arithmetic
+        if len(full_line) <= ICAL_LINE_LENGTH:
+            return full_line
+        step = ICAL_LINE_LENGTH - 1
+        return (ICAL_NEWLINE + ' ').join([
+            full_line[:ICAL_LINE_LENGTH],
+            *(full_line[i:i + step] for i in range(ICAL_LINE_LENGTH, len(full_line), step)),
+        ])
+
+    encoded = full_line.encode('utf-8')
+    total = len(encoded)
+    if total <= ICAL_LINE_LENGTH:
         return full_line
 
-    # Split into chunks of ICAL_LINE_LENGTH (first line) and ICAL_LINE_LENGTH-1 (continuation)
-    result = []
-    result.append(full_line[:ICAL_LINE_LENGTH])
-    remaining = full_line[ICAL_LINE_LENGTH:]
+    # Slice ICAL_LINE_LENGTH octets for the first line and ICAL_LINE_LENGTH-1 for each
+    # continuation, backing a fold off so it never splits a multi-byte character
+    chunks = []
+    start = 0
+    limit = ICAL_LINE_LENGTH
+    while start < total:
+        end = min(start + limit, total)
+        while end < total and (encoded[end] & 0xC0) == 0x80:
+            end -= 1
+        chunks.append(encoded[start:end])
+        start = end
+        limit = ICAL_LINE_LENGTH - 1
 
-    while remaining:
-        # Continuation lines start with space, leaving ICAL_LINE_LENGTH-1 chars for content
-        result.append(' ' + remaining[:ICAL_LINE_LENGTH - 1])
-        remaining = remaining[ICAL_LINE_LENGTH - 1:]
+    return (ICAL_NEWLINE + ' ').encode('utf-8').join(chunks).decode('utf-8')
 
-    return ICAL_NEWLINE.join(result)
 
+@functools.lru_cache(maxsize=None)
+def _parse_time_of_day(time_str: str) -> datetime.time:
+    """Parse an 'HH:MM' (or bare 'HH') notification time.
 
-def generate_alarm(alarm_config: Dict[str, any], release_date: datetime.date) -> str:
-    """Generate a VALARM component for iCalendar based on configuration.
+    Alarm times come from a handful of configured strings, so each is parsed
+    once and reused for every event.
+    """
+    time_parts = time_str.split(':')
+    hours = int(time_parts[0])
+    minutes = int(time_parts[1]) if len(time_parts) > 1 else 0
+    return datetime.time(hours, minutes)
+
+
+def _alarm_plan(alarm_config: Dict[str, Any]) -> Tuple[str, Optional[datetime.timedelta], str]:
+    """Resolve an alarm config into the parts that do not depend on the release date.
 
     Args:
         alarm_config: Dictionary with alarm settings
-        release_date: The date of the film release
 
     Returns:
-        VALARM iCalendar string
+        (description, offset, trigger_line): offset is the trigger time relative to
+        midnight on the release day for absolute triggers (trigger_line is then empty);
+        relative triggers have no offset and a fixed trigger_line
     """
-    # Get the time to use - either specific time for this alarm or global default
-    time_str = alarm_config.get('time', NOTIFICATION_TIME)
-    time_parts = time_str.split(':')
-    hours = int(time_parts[0])
-    minutes = int(time_parts[1]) if len(time_parts) > 1 else 0
+    description = alarm_config.get('description', 'Film Release Reminder')
 
-    # Calculate the trigger time
-    if 'days_before' in alarm_config:
-        days = alarm_config['days_before']
-        # Calculate trigger as absolute datetime with the specified time
-        trigger_datetime = datetime.datetime.combine(release_date, datetime.time(hours, minutes))
-        trigger_datetime -= datetime.timedelta(days=days)
-        trigger = trigger_datetime.strftime('%Y%m%dT%H%M%S')
-        trigger_line = f"TRIGGER;VALUE=DATE-TIME:{trigger}"
-    elif 'hours_before' in alarm_config:
+    if 'hours_before' in alarm_config and 'days_before' not in alarm_config:
         # Legacy support for hours_before
         hours_offset = alarm_config['hours_before']
         if hours_offset < 0:
             # After midnight on the event day
-            trigger = f"PT{abs(hours_offset)}H"
-            trigger_line = f"TRIGGER:{trigger}"
-        else:
-            # Before midnight on the event day
-            trigger = f"-PT{hours_offset}H"
-            trigger_line = f"TRIGGER:{trigger}"
-    else:
-        # Default: day before at NOTIFICATION_TIME
-        trigger_datetime = datetime.datetime.combine(release_date, datetime.time(hours, minutes))
-        trigger_datetime -= datetime.timedelta(days=1)
-        trigger = trigger_datetime.strftime('%Y%m%dT%H%M%S')
-        trigger_line = f"TRIGGER;VALUE=DATE-TIME:{trigger}"
+            return description, None, f"TRIGGER:PT{abs(hours_offset)}H"
+        # Before midnight on the event day
+        return description, None, f"TRIGGER:-PT{hours_offset}H"
 
-    description = alarm_config.get('description', 'Film Release Reminder')
+    # Get the time to use - either specific time for this alarm or global default
+    time_of_day = _parse_time_of_day(alarm_config.get('time', NOTIFICATION_TIME))
+    # Absolute trigger: the given days before the release (default: day before) at that time
+    days = alarm_config.get('days_before', 1)
+    offset = datetime.timedelta(hours=time_of_day.hour, minutes=time_of_day.minute) - datetime.timedelta(days=days)
+    return description, offset, ""
+
+
+def _compile_alarms(notifications: Dict[str, Any]) -> List[Tuple[str, Optional[datetime.timedelta], str]]:
+    """Return the alarm plans for every configured alarm, or none if notifications are off."""
+    if not notifications.get('enabled', False):
+        return []
+    return [_alarm_plan(alarm) for alarm in notifications.get('alarms', [])]
+
+
+def _planned_alarm_lines(
+    plan: Tuple[str, Optional[datetime.timedelta], str],
+    release_date: datetime.date
+) -> List[str]:
+    """Return the content lines of a VALARM component for a precomputed alarm plan."""
+    description, offset, trigger_line = plan
+    if offset is not None:
+        trigger_datetime = datetime.datetime.combine(release_date, datetime.time.min) + offset
+        trigger_line = f"TRIGGER;VALUE=DATE-TIME:{trigger_datetime.strftime('%Y%m%dT%H%M%S')}"
+    return [
+        "BEGIN:VALARM",
+        "ACTION:DISPLAY",
+        f"DESCRIPTION:{description}",
+        trigger_line,
+        "END:VALARM",
+    ]
 
-    return ICAL_NEWLINE.join(
-        [
-            "BEGIN:VALARM",
-            "ACTION:DISPLAY",
-            f"DESCRIPTION:{description}",
-            trigger_line,
-            "END:VALARM",
-            "",
-        ]
-    )
+
+@functools.lru_cache(maxsize=4)
+def _format_dtstamp(timestamp: int) -> str:
+    """Format a POSIX timestamp as an iCalendar UTC DTSTAMP value."""
+    return datetime.datetime.fromtimestamp(timestamp, datetime.timezone.utc).strftime("%Y%m%dT%H%M%SZ")
 
 
 def make_ics_event(
@@ -830,19 +1317,21 @@ def make_ics_event(
     film_title: str,
     cinema_name: str,
     film_url: str = "",
-    film_details: Optional[Dict[str, Any]] = None
+    film_details: Optional[Dict[str, Any]] = None,
+    alarm_plans: Optional[List[Tuple[str, Optional[datetime.timedelta], str]]] = None
 ) -> str:
     """Return an iCalendar VEVENT string for a film release.
 
     Layout A (WTW-only): title (runtime), description, starring, footer.
     Layout B (TMDb-enriched): title (runtime), star rating, genres, description, starring, footer.
     Runtime is always from WTW. Cast shows first 6 names only (no character names).
+    Alarms come from alarm_plans (see _compile_alarms), or from NOTIFICATIONS when not given.
     """
     dtend = release_date + datetime.timedelta(days=1)
     summary = f"{film_title} @ WTW {cinema_name}"
     uid_seed = f"{release_date.isoformat()}|{film_title}|{cinema_name}|{film_url or ''}"
     uid = f"{hashlib.sha1(uid_seed.encode('utf-8')).hexdigest()}@wtw-cinemas-calendar"
-    dtstamp = datetime.datetime.now(datetime.timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    dtstamp = _format_dtstamp(_run_timestamp())
     details = film_details or {}
 
     # Runtime display (always from WTW)
@@ -890,7 +1379,7 @@ def make_ics_event(
 
     description_parts.append(f"\nFilm release at WTW Cinemas {cinema_name}")
     if film_url:
-        description_parts.append("Book tickets: " + film_url)
+        description_parts.append(f"Book tickets: {film_url}")
 
     description = "\n".join(description_parts)
 
@@ -906,72 +1395,17 @@ def make_ics_event(
     ]
     if film_url:
         event_lines.append(escape_and_fold_ical_text(film_url, "URL:"))
-    if NOTIFICATIONS.get('enabled', False):
-        for alarm in NOTIFICATIONS.get('alarms', []):
-            event_lines.append(generate_alarm(alarm, release_date).rstrip(ICAL_NEWLINE))
+    if alarm_plans is None:
+        alarm_plans = _compile_alarms(NOTIFICATIONS)
+    for plan in alarm_plans:
+        event_lines.extend(_planned_alarm_lines(plan, release_date))
     event_lines.extend(["SEQUENCE:0", "END:VEVENT", ""])
     return ICAL_NEWLINE.join(event_lines)
 
 
-def build_index_html(
-    enabled_cinemas: Dict[str, dict],
-    films_by_cinema: Dict[str, List[Tuple]],
-    stats: Optional[Dict[str, int]] = None,
-) -> str:
-    """Build the index HTML page with cinema links, how-to, stats, and featured films."""
-    cinema_list_html = []
-    for cinema_id, info in enabled_cinemas.items():
-        name = info["name"]
-        count = len(films_by_cinema.get(cinema_id, []))
-        ics_url = f"wtw-{cinema_id}.ics"
-        cinema_list_html.append(
-            f"""      <li class="card">
-        <div class="card-icon">🎬</div>
-        <h2>{name}</h2>
-        <p class="meta">{count} upcoming premiere{'' if count == 1 else 's'}</p>
-        <a href="{ics_url}" class="btn"><span class="btn-text-short">Subscribe</span><span class="btn-text-full">Subscribe to calendar</span></a>
-      </li>"""
-        )
-
-    # Featured films: unique (date, title) sorted by date, first 6
-    unique_films = set()
-    for cinema_films in films_by_cinema.values():
-        for f in cinema_films:
-            unique_films.add((f[0], f[1]))  # (release_date, title)
-    featured = sorted(unique_films, key=lambda x: x[0])[:6]
-    featured_html = "".join(
-        f'<div class="featured-film"><span class="date">{d.strftime("%d %b %Y")}</span>{title}</div>'
-        for d, title in featured
-    )
-
-    stats_html = ""
-    if stats:
-        past_30 = stats.get("past_30_days", 0)
-        ytd_past = stats.get("ytd_past", 0)
-        this_month = stats.get("this_month", 0)
-        this_year = stats.get("this_year", 0)
-        total_upcoming = stats.get("total_upcoming", 0)
-        stats_html = f"""
-    <section class="stats-section">
-      <h2>Premiere stats</h2>
-      <p class="stats-intro">Each calendar tracks when each new film premieres at that cinema. Counts are unique films (each film counted once even if at multiple cinemas).</p>
-      <p class="stats-group-title">History</p>
-      <div class="stats-grid">
-        <div class="stat-pill"><span class="value">{past_30}</span><span class="label">last 30 days</span></div>
-        <div class="stat-pill"><span class="value">{ytd_past}</span><span class="label">this year (so far)</span></div>
-      </div>
-      <p class="stats-group-title">Upcoming</p>
-      <div class="stats-grid">
-        <div class="stat-pill"><span class="value">{this_month}</span><span class="label">this month</span></div>
-        <div class="stat-pill"><span class="value">{this_year}</span><span class="label">this year</span></div>
-        <div class="stat-pill"><span class="value">{total_upcoming}</span><span class="label">total upcoming</span></div>
-      </div>
-    </section>"""
-
-    # JavaScript regex for protocol - use variable to avoid backslash in f-string
-    js_protocol_re = r"/^https?:\/\//"
-    cinema_list_joined = chr(10).join(cinema_list_html)
-    return f"""<!DOCTYPE html>
+# Index page template with str.format-style fields (literal CSS/JS braces are doubled).
+# Raw string so the inline JavaScript regex keeps its backslashes.
+INDEX_HTML_TEMPLATE = r"""<!DOCTYPE html>
 <html lang="en">
 <head>
   <meta charset="utf-8">
@@ -1404,7 +1838,7 @@ def build_index_html(
       var href = link.getAttribute('href');
       if (!href) return;
       var abs = new URL(href, window.location.href).href;
-      if (isIOS || isMac) link.href = abs.replace({js_protocol_re}, 'webcal://');
+      if (isIOS || isMac) link.href = abs.replace(/^https?:\/\//, 'webcal://');
       else if (isAndroid) link.href = 'https://www.google.com/calendar/render?cid=' + encodeURIComponent(abs);
     }});
     document.querySelectorAll('.accordion-trigger').forEach(function(btn) {{
@@ -1422,16 +1856,106 @@ def build_index_html(
 </html>"""
 
 
-def validate_configuration() -> None:
+def _split_template(template: str) -> List[str]:
+    """Split a str.format template into the literal text around its fields, braces unescaped."""
+    segments = [""]
+    for literal, field_name, _, _ in string.Formatter().parse(template):
+        segments[-1] += literal
+        if field_name is not None:
+            segments.append("")
+    return segments
+
+
+# Static text around each INDEX_HTML_TEMPLATE field, split once at import
+(
+    INDEX_HTML_HEAD,
+    INDEX_HTML_AFTER_CINEMAS,
+    INDEX_HTML_AFTER_STATS,
+    INDEX_HTML_TAIL,
+) = _split_template(INDEX_HTML_TEMPLATE)
+
+# Premiere stats section of the index page, rendered with str.format
+INDEX_STATS_HTML_TEMPLATE = """
+    <section class="stats-section">
+      <h2>Premiere stats</h2>
+      <p class="stats-intro">Each calendar tracks when each new film premieres at that cinema. Counts are unique films (each film counted once even if at multiple cinemas).</p>
+      <p class="stats-group-title">History</p>
+      <div class="stats-grid">
+        <div class="stat-pill"><span class="value">{past_30_days}</span><span class="label">last 30 days</span></div>
+        <div class="stat-pill"><span class="value">{ytd_past}</span><span class="label">this year (so far)</span></div>
+      </div>
+      <p class="stats-group-title">Upcoming</p>
+      <div class="stats-grid">
+        <div class="stat-pill"><span class="value">{this_month}</span><span class="label">this month</span></div>
+        <div class="stat-pill"><span class="value">{this_year}</span><span class="label">this year</span></div>
+        <div class="stat-pill"><span class="value">{total_upcoming}</span><span class="label">total upcoming</span></div>
+      </div>
+    </section>"""
+
+
+def build_index_html(
+    enabled_cinemas: Dict[str, dict],
+    films_by_cinema: Dict[str, List[FilmRecord]],
+    stats: Optional[Dict[str, int]] = None,
+) -> str:
+    """Build the index HTML page with cinema links, how-to, stats, and featured films."""
+    # Featured films: unique (date, title) sorted by date, first 6
+    unique_films = {
+        (f.release_date, f.title)
+        for cinema_films in films_by_cinema.values()
+        for f in cinema_films
+    }
+    featured = sorted(unique_films, key=lambda x: x[0])[:6]
+
+    stats_html = ""
+    if stats:
+        stats_html = INDEX_STATS_HTML_TEMPLATE.format(
+            past_30_days=stats.get("past_30_days", 0),
+            ytd_past=stats.get("ytd_past", 0),
+            this_month=stats.get("this_month", 0),
+            this_year=stats.get("this_year", 0),
+            total_upcoming=stats.get("total_upcoming", 0),
+        )
+
+    # Every fragment goes into one list, joined once at the end
+    parts: List[str] = []
+    append = parts.append
+    append(INDEX_HTML_HEAD)
+    for i, (cinema_id, info) in enumerate(enabled_cinemas.items()):
+        name = info["name"]
+        count = len(films_by_cinema.get(cinema_id, []))
+        ics_url = f"wtw-{cinema_id}.ics"
+        if i:
+            append("\n")
+        append(
+            f"""      <li class="card">
+        <div class="card-icon">🎬</div>
+        <h2>{name}</h2>
+        <p class="meta">{count} upcoming premiere{'' if count == 1 else 's'}</p>
+        <a href="{ics_url}" class="btn"><span class="btn-text-short">Subscribe</span><span class="btn-text-full">Subscribe to calendar</span></a>
+      </li>"""
+        )
+    append(INDEX_HTML_AFTER_CINEMAS)
+    append(stats_html)
+    append(INDEX_HTML_AFTER_STATS)
+    for d, title in featured:
+        append(f'<div class="featured-film"><span class="date">{d.strftime("%d %b %Y")}</span>{title}</div>')
+    append(INDEX_HTML_TAIL)
+    return "".join(parts)
+
+
+def validate_configuration() -> Dict[str, dict]:
     """Validate the configuration settings.
 
+    Returns:
+        The enabled cinemas from CINEMAS, keyed by cinema ID
+
     Raises:
         ValueError: If configuration is invalid
     """
     # Validate notification time format
     if NOTIFICATIONS.get('enabled', False):
-        time_pattern = re.compile(r'^([0-1]?[0-9]|2[0-3]):[0-5][0-9]$')
-        if not time_pattern.match(NOTIFICATION_TIME):
+        if not TIME_PATTERN.match(NOTIFICATION_TIME):
             raise ValueError(
                 f"Invalid NOTIFICATION_TIME: '{NOTIFICATION_TIME}'. "
                 f"Must be in HH:MM format (e.g., '09:00')"
@@ -1440,7 +1964,7 @@ def validate_configuration() -> None:
         # Validate individual alarm times
         for alarm in NOTIFICATIONS.get('alarms', []):
             if 'time' in alarm:
-                if not time_pattern.match(alarm['time']):
+                if not TIME_PATTERN.match(alarm['time']):
                     raise ValueError(
                         f"Invalid alarm time: '{alarm['time']}'. "
                         f"Must be in HH:MM format (e.g., '18:00')"
@@ -1459,11 +1983,14 @@ def validate_configuration() -> None:
         )
 
     # Validate at least one cinema is enabled
-    if not any(cinema['enabled'] for cinema in CINEMAS.values()):
+    enabled_cinemas = {k: v for k, v in CINEMAS.items() if v['enabled']}
+    if not enabled_cinemas:
         raise ValueError(
             "At least one cinema must be enabled in CINEMAS configuration"
         )
 
+    return enabled_cinemas
+
 
 def main() -> None:
     """Main function to scrape films and generate iCal file.
@@ -1478,42 +2005,52 @@ def main() -> None:
 
     Exits early if no cinemas are enabled or no films are found.
     """
+    global RUN_STARTED_AT
+    RUN_STARTED_AT = int(time.time())
+
     # Validate configuration first
     try:
-        validate_configuration()
+        enabled_cinemas = validate_configuration()
     except ValueError as e:
         logger.error("Configuration error: %s", e)
         print(f"Configuration Error: {e}")
         return
 
-    all_films: List[Tuple[datetime.date, str, str, str, Dict[str, Any], str]] = []
+    all_films: List[FilmRecord] = []
 
     # Load cache
     cache = load_cache()
 
-    # Use cinemas marked enabled in CINEMAS (single source of truth for both local and CI)
-    enabled_cinemas = {k: v for k, v in CINEMAS.items() if v["enabled"]}
-
-    if not enabled_cinemas:
-        logger.error("No cinemas enabled in configuration")
-        print("Error: No cinemas enabled. Please enable at least one cinema in the CINEMAS configuration.")
-        return
-
-    print(f"Scraping {len(enabled_cinemas)} cinema(s): {', '.join([c['name'] for c in enabled_cinemas.values()])}\n")
-
-    # Scrape each enabled cinema (append cinema_id to each film for per-cinema output)
-    for cinema_id, cinema_info in enabled_cinemas.items():
-        cinema_name = cinema_info['name']
-        cinema_url = cinema_info['url']
+    # enabled_cinemas comes from validation: cinemas marked enabled in CINEMAS
+    # (single source of truth for both local and CI), guaranteed non-empty
+    print(f"Scraping {len(enabled_cinemas)} cinema(s): {', '.join(c['name'] for c in enabled_cinemas.values())}\n")
+
+    # Phase 1: scrape each enabled cinema's listing page concurrently, reporting in config order
+    cinema_listings: List[Tuple[str, str, List[Tuple[datetime.date, str, str]]]] = []
+    with ThreadPoolExecutor(max_workers=len(enabled_cinemas)) as executor:
+        listing_futures = [
+            (cinema_id, cinema_info['name'],
+             executor.submit(extract_film_listings, cinema_info['url'], cinema_info['name'], cache))
+            for cinema_id, cinema_info in enabled_cinemas.items()
+        ]
+        for cinema_id, cinema_name, future in listing_futures:
+            try:
+                listings = future.result()
+                cinema_listings.append((cinema_id, cinema_name, listings))
+                print(f"✓ {cinema_name}: Found {len(listings)} film(s)")
+            except Exception as e:
+                logger.error("Error scraping %s: %s", cinema_name, e)
+                print(f"✗ {cinema_name}: Error - {e}")
+
+    # Phase 2: fetch details once per distinct film across all cinemas (uses cache if available)
+    details_by_url = fetch_all_film_details(
+        (film_url for _, _, listings in cinema_listings for _, _, film_url in listings),
+        cache,
+    )
 
-        try:
-            films = extract_films(cinema_url, cinema_name, cache)
-            for f in films:
-                all_films.append((*f, cinema_id))
-            print(f"✓ {cinema_name}: Found {len(films)} film(s)")
-        except Exception as e:
-            logger.error("Error scraping %s: %s", cinema_name, e)
-            print(f"✗ {cinema_name}: Error - {e}")
+    # Phase 3: attach details (tagging each film with its cinema_id for per-cinema output)
+    for cinema_id, cinema_name, listings in cinema_listings:
+        all_films.extend(_films_from_listings(listings, cinema_name, details_by_url, cinema_id))
 
     # Save updated cache
     save_cache(cache)
@@ -1522,33 +2059,36 @@ def main() -> None:
     api_key = (os.environ.get("TMDB_API_KEY") or "").strip()
     if api_key:
         tmdb_cache = load_tmdb_cache()
-        unique_by_key: Dict[str, Tuple[str, str, List[int]]] = {}
-        for i, (release_date, title, cinema_name, film_url, film_details, cinema_id) in enumerate(all_films):
-            key = _tmdb_cache_key(title)
-            if key not in unique_by_key:
-                unique_by_key[key] = (title, film_url, [i])
-            else:
-                unique_by_key[key][2].append(i)
-        for key, (title, film_url, indices) in unique_by_key.items():
-            extra = enrich_film_tmdb(title, film_url, api_key, tmdb_cache)
+        # all_films indices per TMDb key, plus the (title, film_url) of each key's first entry
+        indices_by_key: Dict[str, List[int]] = defaultdict(list)
+        meta_by_key: Dict[str, Tuple[str, str]] = {}
+        for i, film in enumerate(all_films):
+            key = _tmdb_cache_key(film.title)
+            indices_by_key[key].append(i)
+            meta_by_key.setdefault(key, (film.title, film.film_url))
+        # Enrich concurrently; TMDB_RATE_LIMITER keeps the workers within TMDb's rate limit
+        with ThreadPoolExecutor(max_workers=TMDB_WORKERS) as executor:
+            extras = list(executor.map(
+                enrich_film_tmdb,
+                [title for title, _ in meta_by_key.values()],
+                [film_url for _, film_url in meta_by_key.values()],
+                repeat(api_key),
+                repeat(tmdb_cache),
+                repeat(TMDB_FETCH_CREDITS),
+            ))
+        for key, extra in zip(meta_by_key, extras):
             if not extra:
                 continue
-            for i in indices:
-                release_date, t, cinema_name, furl, film_details, cinema_id = all_films[i]
-                film_details = dict(film_details)
-                if extra.get("overview"):
-                    film_details["overview"] = extra["overview"]
-                if extra.get("genres") is not None:
-                    film_details["genres"] = extra["genres"]
-                if extra.get("vote_average") is not None:
-                    film_details["vote_average"] = extra["vote_average"]
-                if extra.get("director"):
-                    film_details["director"] = extra["director"]
-                if extra.get("cast"):
-                    film_details["cast"] = extra["cast"]
-                all_films[i] = (release_date, t, cinema_name, furl, film_details, cinema_id)
+            # Build the TMDb overrides once per film, then apply them to every cinema's entry
+            patch = {k: extra[k] for k in ("overview", "director", "cast") if extra.get(k)}
+            patch.update((k, extra[k]) for k in ("genres", "vote_average") if extra.get(k) is not None)
+            if not patch:
+                continue
+            for i in indices_by_key[key]:
+                film = all_films[i]
+                all_films[i] = film._replace(details={**film.details, **patch})
         save_tmdb_cache(tmdb_cache)
-        logger.info("TMDb enrichment applied (Layout B); %d unique films, %d total entries", len(unique_by_key), len(all_films))
+        logger.info("TMDb enrichment applied (Layout B); %d unique films, %d total entries", len(meta_by_key), len(all_films))
     else:
         logger.info("TMDB_API_KEY not set; using WTW-only data (Layout A)")
 
@@ -1558,31 +2098,29 @@ def main() -> None:
         return
 
     # Sort films by release date, then by cinema name
-    all_films.sort(key=lambda x: (x[0], x[2]))
+    all_films.sort(key=attrgetter('release_date', 'cinema_name'))
 
     # Group by cinema for per-cinema .ics files
-    films_by_cinema: Dict[str, List[Tuple]] = {}
+    films_by_cinema: Dict[str, List[FilmRecord]] = defaultdict(list)
     for f in all_films:
-        cid = f[5]
-        if cid not in films_by_cinema:
-            films_by_cinema[cid] = []
-        films_by_cinema[cid].append(f)
+        films_by_cinema[f.cinema_id].append(f)
 
-    Path(OUTPUT_DIR).mkdir(parents=True, exist_ok=True)
+    out_dir = Path(OUTPUT_DIR)
+    out_dir.mkdir(parents=True, exist_ok=True)
 
     # Remove old .ics files without wtw- prefix (e.g. after rename)
-    output_dir = Path(OUTPUT_DIR)
-    for old_ics in output_dir.glob("*.ics"):
-        if not old_ics.name.startswith("wtw-"):
-            old_ics.unlink()
-            logger.info("Removed legacy %s", old_ics.name)
-
-    for cinema_id in enabled_cinemas:
-        cinema_name = enabled_cinemas[cinema_id]["name"]
+    with os.scandir(OUTPUT_DIR) as entries:
+        for entry in entries:
+            name = entry.name
+            if name.endswith(".ics") and not name.startswith("wtw-") and entry.is_file():
+                os.unlink(entry.path)
+                logger.info("Removed legacy %s", name)
+
+    # Alarm settings are fixed for the run, so resolve their trigger offsets once
+    alarm_plans = _compile_alarms(NOTIFICATIONS)
+    for cinema_id, cinema_info in enabled_cinemas.items():
+        cinema_name = cinema_info["name"]
         cinema_films = films_by_cinema.get(cinema_id, [])
-        events = []
-        for release_date, title, cname, film_url, film_details, _ in cinema_films:
-            events.append(make_ics_event(release_date, title, cname, film_url, film_details))
         calendar_lines = [
             "BEGIN:VCALENDAR",
             "VERSION:2.0",
@@ -1597,46 +2135,69 @@ def main() -> None:
         calendar_lines.extend([
             "REFRESH-INTERVAL;VALUE=DURATION:PT12H",
             "X-PUBLISHED-TTL:PT12H",
+            "",
         ])
-        ical = (
-            ICAL_NEWLINE.join(calendar_lines)
-            + ICAL_NEWLINE
-            + "".join(events)
-            + f"END:VCALENDAR{ICAL_NEWLINE}"
-        )
-        out_path = Path(OUTPUT_DIR) / f"wtw-{cinema_id}.ics"
-        out_path.write_text(ical, encoding="utf-8")
-        logger.info("Wrote %s (%d events)", out_path, len(events))
+        # Stream header, events and footer into one buffer; newline='' keeps CRLF intact
+        buf = io.StringIO(newline="")
+        buf.write(ICAL_NEWLINE.join(calendar_lines))
+        for f in cinema_films:
+            buf.write(make_ics_event(f.release_date, f.title, f.cinema_name, f.film_url, f.details, alarm_plans))
+        buf.write(f"END:VCALENDAR{ICAL_NEWLINE}")
+        out_path = out_dir / f"wtw-{cinema_id}.ics"
+        if _write_bytes_if_changed(out_path, buf.getvalue().encode("utf-8"), ignore=DTSTAMP_LINE_PATTERN):
+            logger.info("Wrote %s (%d events)", out_path, len(cinema_films))
+        else:
+            logger.info("%s unchanged (%d events)", out_path, len(cinema_films))
 
     # Release-date stats: History from persisted file, Upcoming from this run
-    today = datetime.date.today()
-    unique_releases = set((f[0], f[1]) for f in all_films)  # (release_date, title)
+    today = _run_date()
+    unique_releases = {(f.release_date, f.title) for f in all_films}
     release_history = load_release_history()
-    release_history |= unique_releases
+    release_history.update(unique_releases)
     save_release_history(release_history)
     past_cutoff_30 = today - datetime.timedelta(days=30)
+    year, month = today.year, today.month
+    # One pass over each set: history counts past releases, upcoming counts this run's
+    past_30 = ytd_past = 0
+    for d, _ in release_history:
+        if d <= today:
+            if d >= past_cutoff_30:
+                past_30 += 1
+            if d < today and d.year == year:
+                ytd_past += 1
+    this_month = this_year = total_upcoming = 0
+    for d, _ in unique_releases:
+        if d >= today:
+            total_upcoming += 1
+            if d.year == year:
+                this_year += 1
+                if d.month == month:
+                    this_month += 1
     release_stats = {
-        "past_30_days": sum(1 for (d, _) in release_history if past_cutoff_30 <= d <= today),
-        "ytd_past": sum(1 for (d, _) in release_history if d.year == today.year and d < today),
-        "this_month": sum(1 for (d, _) in unique_releases if d.year == today.year and d.month == today.month and d >= today),
-        "this_year": sum(1 for (d, _) in unique_releases if d.year == today.year and d >= today),
-        "total_upcoming": sum(1 for (d, _) in unique_releases if d >= today),
+        "past_30_days": past_30,
+        "ytd_past": ytd_past,
+        "this_month": this_month,
+        "this_year": this_year,
+        "total_upcoming": total_upcoming,
     }
 
     # Index page with links, how-to, and stats
     index_html = build_index_html(enabled_cinemas, films_by_cinema, stats=release_stats)
-    Path(OUTPUT_DIR, "index.html").write_text(index_html, encoding="utf-8")
-    logger.info("Wrote %s/index.html", OUTPUT_DIR)
+    if _write_bytes_if_changed(out_dir / "index.html", index_html.encode("utf-8")):
+        logger.info("Wrote %s/index.html", OUTPUT_DIR)
 
     print(f"\n✓ Created {OUTPUT_DIR}/ with {len(films_by_cinema)} calendar(s) and index page\n")
 
-    # Group films by date for display
-    for release_date, date_group in groupby(all_films, key=lambda x: x[0]):
-        films_on_date = list(date_group)
-        print(f"{release_date.strftime('%d %B %Y')}:")
-        for _, title, cinema_name, _, _, _ in films_on_date:
-            print(f"  • {title} @ {cinema_name}")
+    # Group films by date for display; build the summary and write it in one go
+    summary = []
+    for release_date, date_group in groupby(all_films, key=attrgetter('release_date')):
+        summary.append(f"{release_date.strftime('%d %B %Y')}:\n")
+        for f in date_group:
+            summary.append(f"  • {f.title} @ {f.cinema_name}\n")
+    sys.stdout.write("".join(summary))
 
 
 if __name__ == "__main__":
-    main()
+    # Close pooled connections once the run is done
+    with SESSION:
+        main()